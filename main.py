@@ -1,15 +1,40 @@
 from __future__ import annotations
 
-import argparse
-import subprocess
+import atexit
+import hashlib
+import json
+import os
+import re
 import sys
-from datetime import datetime, timedelta, timezone
-from typing import Sequence
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping, NamedTuple, Sequence
+
+if TYPE_CHECKING:
+    import argparse
+    import sqlite3
+
+    import requests
+
+try:  # optional faster decoders; all raise a ValueError subclass on bad input
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads  # type: ignore
+    except ImportError:
+        json_loads = json.loads  # type: ignore
 
 GDELT_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
 MAX_RECORDS = 250
 MIN_KEYWORD_LEN = 3
+MAX_PARALLEL_FETCHES = 16
 YAHOO_SEARCH_URL = "https://query1.finance.yahoo.com/v1/finance/search"
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+MAX_CACHE_TTL = 900
+ENGLISH_LANGUAGES = frozenset({"English", "english", "en"})
+GDELT_HEADERS = {"Accept-Encoding": "gzip", "Accept": "application/json"}
+_HAS_WS = re.compile(r"\s").search
 EXAMPLE_COMMANDS = [
     'MSFT -k "guidance, investigation" -d 5 -l 40',
     '"NVIDIA" -k "ai, chips, guidance"',
@@ -20,22 +45,122 @@ EXAMPLE_COMMANDS = [
 ]
 
 
-def ensure_requests():
+class Article(NamedTuple):
+    title: str | None
+    url: str | None
+    seendate: str | None
+    source: str | None
+    language: str | None
+    domain: str | None
+
+
+_SESSION: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """
+    Return a shared requests.Session so repeated queries reuse pooled keep-alive connections.
+    Created lazily on first use and closed at interpreter exit.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUSES),
+            ),
+        )
+        atexit.register(session.close)
+        _SESSION = session
+    return _SESSION
+
+
+def _cache_path() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "stock-news", "gdelt.sqlite3")
+
+
+def _cache_connect() -> sqlite3.Connection:
+    import sqlite3
+
+    path = _cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache(k TEXT PRIMARY KEY, ts REAL, body BLOB)")
+    return conn
+
+
+def _cache_key(params: Mapping[str, object]) -> str:
+    return hashlib.blake2b(json.dumps(params, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str, max_age: float) -> bytes | None:
+    """
+    Return the cached response body for `key` if it is younger than `max_age` seconds.
+    Cache failures (locked/read-only disk) are treated as a miss.
+    """
+    if max_age <= 0:
+        return None
+    import sqlite3
+
+    try:
+        conn = _cache_connect()
+        try:
+            row = conn.execute("SELECT ts, body FROM cache WHERE k = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None or time.time() - row[0] > max_age:
+        return None
+    body: bytes = row[1]
+    return body
+
+
+def _cache_set(key: str, body: bytes) -> None:
+    import sqlite3
+
     try:
-        import requests  # type: ignore
-        return requests
-    except ModuleNotFoundError:
-        print("Installing requests...", flush=True)
-        subprocess.run([sys.executable, "-m", "pip", "install", "requests"], check=True)
-        import requests  # type: ignore
-        return requests
+        conn = _cache_connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache(k, ts, body) VALUES (?, ?, ?)",
+                    (key, time.time(), body),
+                )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def clear_cache() -> None:
+    """Remove every cached GDELT response."""
+    path = _cache_path()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def default_cache_ttl(days: int) -> int:
+    """
+    Freshness-aware TTL: narrow day windows expire sooner, capped at MAX_CACHE_TTL seconds.
+    """
+    if days <= 0:
+        return MAX_CACHE_TTL
+    return min(MAX_CACHE_TTL, days * 60)
 
 
 def _normalize_term(term: str) -> str:
-    term = term.strip()
-    if not term:
-        return ""
-    if " " in term:
+    """Quote an already-stripped, non-empty term if it contains any whitespace."""
+    if _HAS_WS(term):
         return f'"{term}"'
     return term
 
@@ -43,7 +168,7 @@ def _normalize_term(term: str) -> str:
 def normalize_keywords(raw_keywords: Sequence[str] | None) -> tuple[list[str], list[str]]:
     """
     Split comma-separated keywords, trim, drop empties, and collect too-short ones.
-    Returns (usable_keywords, skipped_keywords).
+    Returns (usable_terms, skipped_keywords); usable terms are already quoted for GDELT.
     """
     if not raw_keywords:
         return [], []
@@ -51,16 +176,15 @@ def normalize_keywords(raw_keywords: Sequence[str] | None) -> tuple[list[str], l
     usable: list[str] = []
     skipped: list[str] = []
 
-    for item in raw_keywords:
-        parts = item.split(",")
-        for part in parts:
-            kw = part.strip()
-            if not kw:
-                continue
-            if len(kw) < MIN_KEYWORD_LEN:
-                skipped.append(kw)
-                continue
-            usable.append(kw)
+    # One split over the joined input; strip() below handles whitespace around commas.
+    for part in ",".join(raw_keywords).split(","):
+        kw = part.strip()
+        if not kw:
+            continue
+        if len(kw) < MIN_KEYWORD_LEN:
+            skipped.append(kw)
+            continue
+        usable.append(_normalize_term(kw))
 
     return usable, skipped
 
@@ -86,11 +210,10 @@ def expand_symbol_to_company_name(symbol: str) -> str | None:
     if not looks_like_ticker(symbol):
         return None
 
-    requests = ensure_requests()
     try:
-        resp = requests.get(
+        resp = get_session().get(
             YAHOO_SEARCH_URL,
-            params={"q": symbol, "quotesCount": 1, "newsCount": 0},
+            params={"q": symbol, "quotesCount": "1", "newsCount": "0"},
             timeout=5,
         )
         resp.raise_for_status()
@@ -103,13 +226,23 @@ def expand_symbol_to_company_name(symbol: str) -> str | None:
         quote_sym = (quote.get("symbol") or "").upper()
         if quote_sym != sym_upper:
             continue
-        name = quote.get("longname") or quote.get("shortname")
+        name: str | None = quote.get("longname") or quote.get("shortname")
         if name:
             return name.strip()
     return None
 
 
 def build_query(symbol: str, keywords: Sequence[str] | None, english_only: bool = True) -> str:
+    """
+    Build the GDELT query string. `keywords` are the usable terms from normalize_keywords
+    (already stripped and phrase-quoted); blank entries are dropped.
+    """
+    terms = tuple(k for k in keywords if k and not k.isspace()) if keywords else ()
+    return _build_query_cached(symbol, terms, english_only)
+
+
+@lru_cache(maxsize=512)
+def _build_query_cached(symbol: str, keywords: tuple[str, ...], english_only: bool) -> str:
     symbol = symbol.strip()
     if not symbol:
         raise ValueError("A stock symbol or company name is required.")
@@ -123,21 +256,13 @@ def build_query(symbol: str, keywords: Sequence[str] | None, english_only: bool
     else:
         symbol_clause = f'("{symbol}" OR {symbol})'
 
-    parts: list[str] = [symbol_clause]
-
-    if keywords:
-        normalized = [_normalize_term(k) for k in keywords]
-        normalized = [k for k in normalized if k]
-        if normalized:
-            if len(normalized) == 1:
-                parts.append(normalized[0])
-            else:
-                parts.append("(" + " OR ".join(normalized) + ")")
-
-    if english_only:
-        parts.append("sourcelang:english")
-
-    return " AND ".join(parts)
+    lang_clause = " AND sourcelang:english" if english_only else ""
+    # Most invocations carry zero or one keyword; build those without the join.
+    if not keywords:
+        return f"{symbol_clause}{lang_clause}"
+    if len(keywords) == 1:
+        return f"{symbol_clause} AND {keywords[0]}{lang_clause}"
+    return f"{symbol_clause} AND ({' OR '.join(keywords)}){lang_clause}"
 
 
 def fetch_articles(
@@ -146,15 +271,54 @@ def fetch_articles(
     days: int = 3,
     limit: int = 25,
     english_only: bool = True,
-):
+    use_cache: bool = True,
+    cache_ttl: float | None = None,
+) -> list[Article]:
+    """
+    Fetch matching articles, newest first. `keywords` are the usable terms returned by
+    normalize_keywords; raw multi-word keywords are not quoted here. English-only runs
+    reuse a cached --allow-non-english page when filtering it still fills `limit`;
+    otherwise GDELT applies sourcelang:english server-side.
+    """
     limit = max(1, min(limit, MAX_RECORDS))
     days = max(0, days)
+    if cache_ttl is None:
+        cache_ttl = default_cache_ttl(days)
+
+    if english_only and use_cache:
+        _, key = _gdelt_params(symbol, keywords, days, limit, english_only=False)
+        body = _cache_get(key, cache_ttl)
+        if body is not None:
+            page = _parse_articles(body)
+            english = [article for article in page if article.language in ENGLISH_LANGUAGES]
+            # A page shorter than `limit` is GDELT's whole result set, so its English rows are too.
+            if len(english) >= limit or len(page) < limit:
+                return english[:limit]
+
+    params, key = _gdelt_params(symbol, keywords, days, limit, english_only)
+    body = _cache_get(key, cache_ttl) if use_cache else None
+    if body is not None:
+        return _parse_articles(body)
+
+    response = get_session().get(GDELT_URL, params=params, headers=GDELT_HEADERS, timeout=10)
+    response.raise_for_status()
+    body = response.content
+    articles = _parse_articles(body)
+    if use_cache:
+        _cache_set(key, body)
+    return articles
 
-    query = build_query(symbol, keywords, english_only)
-    requests = ensure_requests()
 
-    params = {
-        "query": query,
+def _gdelt_params(
+    symbol: str,
+    keywords: Sequence[str] | None,
+    days: int,
+    limit: int,
+    english_only: bool,
+) -> tuple[dict[str, str | int], str]:
+    """Return the ArtList request params and their cache key."""
+    params: dict[str, str | int] = {
+        "query": build_query(symbol, keywords, english_only),
         "mode": "ArtList",
         "format": "json",
         "maxrecords": limit,
@@ -162,16 +326,23 @@ def fetch_articles(
     }
 
     if days > 0:
+        from datetime import datetime, timedelta, timezone
+
         start = datetime.now(timezone.utc) - timedelta(days=days)
-        params["startdatetime"] = start.strftime("%Y%m%d%H%M%S")
+        params["startdatetime"] = (
+            f"{start.year:04d}{start.month:02d}{start.day:02d}"
+            f"{start.hour:02d}{start.minute:02d}{start.second:02d}"
+        )
 
-    response = requests.get(GDELT_URL, params=params, timeout=10)
-    response.raise_for_status()
-    raw_text = response.text
+    # Key on the day window rather than the absolute start time, which changes every second.
+    return params, _cache_key({**params, "startdatetime": None, "days": days})
+
+
+def _parse_articles(body: bytes) -> list[Article]:
     try:
-        data = response.json()
+        data = json_loads(body)
     except ValueError as exc:
-        snippet = (raw_text or "").strip()
+        snippet = body.decode("utf-8", "replace").strip()
         lower = snippet.lower()
         if "phrase is too short" in lower:
             hint = (
@@ -189,44 +360,182 @@ def fetch_articles(
         if msg:
             raise RuntimeError(f"GDELT returned an error: {msg}")
 
-    articles = data.get("articles", [])
-    results = []
-    for article in articles:
-        results.append(
-            {
-                "title": article.get("title"),
-                "url": article.get("url"),
-                "seendate": article.get("seendate"),
-                "source": article.get("sourceCommonName") or article.get("sourcecountry"),
-                "language": article.get("language"),
-                "domain": article.get("domain"),
-            }
+    return [
+        Article(
+            article.get("title"),
+            article.get("url"),
+            article.get("seendate"),
+            article.get("sourceCommonName") or article.get("sourcecountry"),
+            article.get("language"),
+            article.get("domain"),
         )
+        for article in data.get("articles", ())
+    ]
+
+
+def fetch_with_fallback(
+    symbol: str,
+    keywords: Sequence[str] | None = None,
+    days: int = 3,
+    limit: int = 25,
+    english_only: bool = True,
+    use_cache: bool = True,
+    cache_ttl: float | None = None,
+    notify: Callable[[str], None] | None = None,
+) -> list[Article]:
+    """
+    fetch_articles, retrying once with the Yahoo-resolved company name when GDELT rejects
+    a short ticker with "phrase is too short". `keywords` come from normalize_keywords.
+    The retry notice goes to `notify` (default: printed immediately).
+    """
+    try:
+        return fetch_articles(symbol, keywords, days, limit, english_only, use_cache, cache_ttl)
+    except RuntimeError as exc:
+        if "phrase is too short" not in str(exc).lower():
+            raise
+        expanded = expand_symbol_to_company_name(symbol)
+        if not expanded or expanded.lower() == symbol.lower():
+            raise
+        notice = (
+            f'Query phrase too short for "{symbol}". '
+            f'Retrying with company name "{expanded}".'
+        )
+        if notify is None:
+            print(notice, flush=True)
+        else:
+            notify(notice)
+        return fetch_articles(expanded, keywords, days, limit, english_only, use_cache, cache_ttl)
+
+
+def _iter_fetches(
+    symbols: Sequence[str],
+    keywords: Sequence[str] | None,
+    days: int,
+    limit: int,
+    english_only: bool,
+    use_cache: bool,
+    cache_ttl: float | None,
+) -> Iterator[tuple[int, list[Article] | Exception, list[str]]]:
+    """
+    Run fetch_with_fallback for each symbol on a thread pool sharing one session and yield
+    (index, articles or exception, retry notices) in completion order. Notices are collected
+    per symbol rather than printed from the workers, so output does not interleave.
+    """
+    if not symbols:
+        return
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    get_session()  # build once up front so worker threads share one pool
+    workers = min(MAX_PARALLEL_FETCHES, len(symbols))
+    notices: list[list[str]] = [[] for _ in symbols]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                fetch_with_fallback,
+                symbol,
+                keywords,
+                days,
+                limit,
+                english_only,
+                use_cache,
+                cache_ttl,
+                notices[idx].append,
+            ): idx
+            for idx, symbol in enumerate(symbols)
+        }
+        for future in as_completed(futures):
+            try:
+                result: list[Article] | Exception = future.result()
+            except Exception as exc:
+                result = exc
+            idx = futures[future]
+            yield idx, result, notices[idx]
+
+
+def fetch_many(
+    symbols: Sequence[str],
+    keywords: Sequence[str] | None = None,
+    days: int = 3,
+    limit: int = 25,
+    english_only: bool = True,
+    use_cache: bool = True,
+    cache_ttl: float | None = None,
+) -> list[list[Article] | Exception]:
+    """
+    Fetch articles for several symbols concurrently over the shared session.
+    Arguments match fetch_with_fallback (`keywords` from normalize_keywords); results keep
+    the order of `symbols`, with a symbol's exception in its slot instead of aborting the batch.
+    Company-name retry notices are not printed.
+    """
+    results: list[list[Article] | Exception] = [[] for _ in symbols]
+    fetches = _iter_fetches(symbols, keywords, days, limit, english_only, use_cache, cache_ttl)
+    for idx, result, _ in fetches:
+        results[idx] = result
     return results
 
 
-def print_articles(articles: list[dict[str, str | None]]) -> None:
+def fetch_many_as_completed(
+    symbols: Sequence[str],
+    keywords: Sequence[str] | None = None,
+    days: int = 3,
+    limit: int = 25,
+    english_only: bool = True,
+    use_cache: bool = True,
+    cache_ttl: float | None = None,
+) -> Iterator[tuple[str, list[Article] | Exception, list[str]]]:
+    """
+    Like fetch_many, but yield (symbol, articles or exception, retry notices) as each fetch
+    finishes so callers can start printing while slower queries are still in flight.
+    """
+    fetches = _iter_fetches(symbols, keywords, days, limit, english_only, use_cache, cache_ttl)
+    for idx, result, notices in fetches:
+        yield symbols[idx], result, notices
+
+
+def print_articles(articles: list[Article]) -> None:
     if not articles:
         print("No articles found.")
         return
 
+    # Build the whole listing first so it goes out in a single write.
+    buf: list[str] = []
+    append = buf.append
     for idx, article in enumerate(articles, 1):
-        title = article.get("title") or "No title"
-        source = article.get("source") or "unknown source"
-        date = article.get("seendate") or "unknown date"
-        lang = article.get("language") or "?"
-        url = article.get("url") or "unknown URL"
+        title = article.title or "No title"
+        source = article.source or "unknown source"
+        date = article.seendate or "unknown date"
+        lang = article.language or "?"
+        url = article.url or "unknown URL"
+
+        append(
+            f"[{idx}] {title}\n"
+            f"    Source: {source} | Date: {date} | Lang: {lang}\n"
+            f"    URL: {url}\n\n"
+        )
+    sys.stdout.write("".join(buf))
+
 
-        print(f"[{idx}] {title}")
-        print(f"    Source: {source} | Date: {date} | Lang: {lang}")
-        print(f"    URL: {url}\n")
+def split_symbols(raw: str) -> list[str]:
+    """Split a comma-separated --symbols value, dropping blanks."""
+    return [s.strip() for s in raw.split(",") if s.strip()]
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Search stock-related news via GDELT (English-only by default)."
     )
-    parser.add_argument("symbol", help="Stock symbol or company name (e.g., MSFT or Microsoft)")
+    parser.add_argument(
+        "symbol",
+        nargs="?",
+        help="Stock symbol or company name (e.g., MSFT or Microsoft)",
+    )
+    parser.add_argument(
+        "--symbols",
+        default=None,
+        help="Comma-separated symbols/company names to fetch concurrently (e.g., MSFT,AAPL,NVDA).",
+    )
     parser.add_argument(
         "-k",
         "--keyword",
@@ -254,7 +563,80 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         action="store_true",
         help="Disable the English-only filter (default keeps only English).",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query GDELT instead of reusing a cached response.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help=f"Seconds a cached response stays valid (default: min({MAX_CACHE_TTL}, days*60)).",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete all cached GDELT responses and exit unless a symbol is given.",
+    )
+    args = parser.parse_args(argv)
+    if args.symbols is not None and not split_symbols(args.symbols):
+        parser.error("--symbols needs at least one symbol")
+    if not args.symbol and not args.symbols and not args.clear_cache:
+        parser.error("a symbol or --symbols is required")
+    return args
+
+
+def _fast_parse_args(argv: Sequence[str]) -> SimpleNamespace | None:
+    """
+    Parse the common invocation (one symbol plus -k/-d/-l/--allow-non-english) without argparse.
+    Returns None for anything else (help, other flags, bad values) so parse_args can handle it.
+    """
+    args = SimpleNamespace(
+        symbol=None,
+        symbols=None,
+        keywords=None,
+        days=3,
+        limit=25,
+        allow_non_english=False,
+        no_cache=False,
+        cache_ttl=None,
+        clear_cache=False,
+    )
+    i = 0
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        if arg == "--allow-non-english":
+            args.allow_non_english = True
+        elif arg in ("-k", "--keyword", "-d", "--days", "-l", "--limit"):
+            i += 1
+            if i == n:
+                return None
+            value = argv[i]
+            if arg in ("-k", "--keyword"):
+                if value.startswith("-"):
+                    return None
+                if args.keywords is None:
+                    args.keywords = []
+                args.keywords.append(value)
+            else:
+                try:
+                    number = int(value)
+                except ValueError:
+                    return None
+                if arg in ("-d", "--days"):
+                    args.days = number
+                else:
+                    args.limit = number
+        elif arg.startswith("-") or args.symbol is not None:
+            return None
+        else:
+            args.symbol = arg
+        i += 1
+    if not args.symbol:
+        return None
+    return args
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -266,9 +648,15 @@ def main(argv: Sequence[str] | None = None) -> int:
         print("\nUse -h/--help for full options.")
         return 1
 
-    args = parse_args(args_list)
+    args = _fast_parse_args(args_list) or parse_args(args_list)
 
     try:
+        if args.clear_cache:
+            clear_cache()
+            print("Cache cleared.")
+            if not args.symbol and not args.symbols:
+                return 0
+
         keywords, skipped = normalize_keywords(args.keywords)
         if skipped:
             print(
@@ -276,32 +664,41 @@ def main(argv: Sequence[str] | None = None) -> int:
                 flush=True,
             )
 
-        def do_fetch(target_symbol: str):
-            return fetch_articles(
-                symbol=target_symbol,
+        if args.symbols:
+            symbols = split_symbols(args.symbols)
+            if args.symbol:
+                symbols.insert(0, args.symbol)
+            results = fetch_many_as_completed(
+                symbols,
                 keywords=keywords,
                 days=args.days,
                 limit=args.limit,
                 english_only=not args.allow_non_english,
+                use_cache=not args.no_cache,
+                cache_ttl=args.cache_ttl,
             )
-
-        try:
-            articles = do_fetch(args.symbol)
-        except RuntimeError as exc:
-            msg = str(exc).lower()
-            fallback_used = False
-            if "phrase is too short" in msg:
-                expanded = expand_symbol_to_company_name(args.symbol)
-                if expanded and expanded.lower() != args.symbol.lower():
-                    print(
-                        f'Query phrase too short for "{args.symbol}". '
-                        f'Retrying with company name "{expanded}".',
-                        flush=True,
-                    )
-                    articles = do_fetch(expanded)
-                    fallback_used = True
-            if not fallback_used:
-                raise
+            status = 0
+            for target_symbol, result, notices in results:
+                print(f"=== {target_symbol} ===")
+                for notice in notices:
+                    print(notice)
+                if isinstance(result, Exception):
+                    print(f"Error: {result}\n")
+                    status = 1
+                else:
+                    print_articles(result)
+                sys.stdout.flush()
+            return status
+
+        articles = fetch_with_fallback(
+            args.symbol,
+            keywords,
+            days=args.days,
+            limit=args.limit,
+            english_only=not args.allow_non_english,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+        )
     except Exception as exc:  # pragma: no cover - CLI error path
         print(f"Error: {exc}")
         return 1
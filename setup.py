@@ -0,0 +1,37 @@
+"""
+Native build: compiles main.py with mypyc (build requirements live in pyproject.toml).
+
+    pip install .                                          # compiled module + `stock-news` command
+    pip install mypy types-requests && python setup.py build_ext --inplace
+
+Set STOCK_NEWS_PURE=1 to install the pure-Python module without compiling.
+"""
+import os
+
+from setuptools import setup
+
+if os.environ.get("STOCK_NEWS_PURE"):
+    ext_modules = []
+else:
+    try:
+        from mypyc.build import mypycify
+    except ImportError as exc:
+        raise SystemExit(
+            "mypyc is required for the compiled build (pip install mypy), "
+            "or set STOCK_NEWS_PURE=1 to install the pure-Python module."
+        ) from exc
+    ext_modules = mypycify(["main.py"])
+
+with open("requirements.txt", encoding="utf-8") as fh:
+    install_requires = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+
+setup(
+    name="stock-news",
+    version="0.1.0",
+    description="Search stock-related news via GDELT.",
+    py_modules=["main"],
+    ext_modules=ext_modules,
+    install_requires=install_requires,
+    python_requires=">=3.9",
+    entry_points={"console_scripts": ["stock-news = main:main"]},
+)